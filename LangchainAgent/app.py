@@ -3,16 +3,94 @@ Resource Management Agent - Streamlit UI
 """
 
 import streamlit as st
+import logging
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from dotenv import load_dotenv
-from src.master_agent import MasterAgent
-from src.query_translator import QueryTranslator
-from src.resource_fetcher import ResourceFetcher
-from src.response_generator import ResponseGenerator
-from src.firebase_utils import FirebaseClient
+
+logger = logging.getLogger(__name__)
+
+# Directory containing this script, used to locate bundled docs
+_PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Chat messages longer than the preview limit are collapsed behind an expander;
+# messages longer than the markdown limit are shown as plain text to skip parsing
+_MARKDOWN_PREVIEW_CHARS = 4000
+_MAX_MARKDOWN_CHARS = 32000
+
+# Number of most recent chat messages rendered before older history is requested
+_VISIBLE_HISTORY = 50
+# Number of chat messages kept per session; older ones are dropped
+_MAX_HISTORY = 200
+# Speaker labels used when earlier history is rendered as a single block
+_ROLE_LABELS = {"user": "🧑 You", "assistant": "🧞 Genie"}
+
+# Static markdown blocks rendered by the UI
+_FIREBASE_SETUP_MD = """
+## Adding Employee Data to Firebase
+
+1. Go to your [Firebase Console](https://console.firebase.google.com/)
+2. Navigate to your project > Firestore Database
+3. Create a collection named `employees`
+4. Add employee documents with the following structure:
+
+```json
+{
+  "name": "John Doe",
+  "employee_number": "EMP123",
+  "location": "London", 
+  "rank": {
+    "official_name": "Senior Consultant"
+  },
+  "skills": ["python", "machine learning", "aws"]
+}
+```
+
+5. Create a separate collection named `availability`
+6. Add availability documents with employee numbers as document IDs
+7. For each availability document, create a subcollection named `weeks`
+8. In each `weeks` subcollection, add documents for different weeks with the following structure:
+
+```json
+{
+  "week_number": 1,
+  "status": "available",
+  "hours": 40,
+  "notes": "Working on Project X"
+}
+```
+
+For more details, see the Firebase Setup Guide.
+"""
+
+_SAMPLE_QUERIES_MD = """
+Try these example queries:
+- "Find frontend developers in London"
+- "Who are the consultants available in Week 3?"
+- "Show me Solution Architects in Oslo"
+- "Find employees with rank above consultant"
+"""
+
+_ABOUT_MD = """
+Resource Genie helps you find the right resources for your project.
+
+You can ask questions like:
+- Find frontend developers in London
+- Show me Senior Consultants with Python skills
+- Who is available in Week 3?
+- Find employees with React skills who are available next week
+"""
+
+@st.cache_resource(show_spinner=False)
+def _load_env_once():
+    """Load environment variables from the .env file once per process."""
+    load_dotenv()
+    return True
 
 # Load environment variables from .env file
-load_dotenv()
+_load_env_once()
 
 # Set page config - must be the first Streamlit command
 st.set_page_config(
@@ -22,150 +100,181 @@ st.set_page_config(
 )
 
 # Initialize session state
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-if "agent" not in st.session_state:
-    st.session_state.agent = None
-if "firebase_client" not in st.session_state:
-    st.session_state.firebase_client = None
+st.session_state.setdefault("messages", deque(maxlen=_MAX_HISTORY))
+st.session_state.setdefault("agent", None)
 
-# Check for required environment variables
-anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
-# Try to get the API key from Streamlit secrets if not in environment variables
-if not anthropic_api_key and 'ANTHROPIC_API_KEY' in st.secrets:
-    anthropic_api_key = st.secrets['ANTHROPIC_API_KEY']
+@st.cache_resource(show_spinner=False)
+def _resolve_setting(name):
+    """Resolve a setting from the environment, falling back to Streamlit secrets."""
+    value = os.getenv(name)
+    if not value and name in st.secrets:
+        value = st.secrets[name]
+    if not value:
+        # Raising keeps a missing setting out of the cache, so it is picked up
+        # once added without restarting the server
+        raise KeyError(name)
+    return value
 
-firebase_creds_path = os.getenv("FIREBASE_CREDENTIALS_PATH")
-# Try to get the credentials path from Streamlit secrets if not in environment variables
-if not firebase_creds_path and 'FIREBASE_CREDENTIALS_PATH' in st.secrets:
-    firebase_creds_path = st.secrets['FIREBASE_CREDENTIALS_PATH']
+def get_setting(name):
+    """Return a resolved setting, or None if it is not configured."""
+    try:
+        return _resolve_setting(name)
+    except KeyError:
+        return None
+
+def get_api_key():
+    """Resolve ANTHROPIC_API_KEY from the environment, falling back to Streamlit secrets."""
+    return get_setting("ANTHROPIC_API_KEY")
+
+def get_firebase_creds_path():
+    """Resolve FIREBASE_CREDENTIALS_PATH from the environment, falling back to Streamlit secrets."""
+    return get_setting("FIREBASE_CREDENTIALS_PATH")
+
+# Check for required environment variables
+anthropic_api_key = get_api_key()
 
 if not anthropic_api_key:
     st.error("⚠️ ANTHROPIC_API_KEY not found in environment variables or Streamlit secrets.")
     st.info("Please set your ANTHROPIC_API_KEY environment variable or add it to your Streamlit secrets.")
     st.stop()
 
-# Initialize Firebase only once if not already initialized
-if st.session_state.firebase_client is None:
-    try:
-        st.session_state.firebase_client = FirebaseClient()
-        
-        # Verify Firebase setup
-        verification = st.session_state.firebase_client.verify_firebase_setup()
-        
-        if verification['employees_exist'] and verification['availability_exist']:
-            pass  # Success message removed
-        elif verification['employees_exist']:
-            st.warning(f"⚠️ {verification['message']}")
-            st.info("""
-            Your Firebase connection is working, and you have employees, but the availability data is missing or not structured correctly.
-            
-            You need to ensure proper availability data in your Firestore database for the application to work correctly.
-            """)
-        else:
-            st.warning(f"⚠️ {verification['message']}")
-            st.info("""
-            Your Firebase connection is working, but there are no employees in the 'employees' collection.
-            
-            You need to add employee documents to your Firestore database for the application to work correctly.
-            """)
-            
-            with st.expander("How to Add Employee Data to Firebase", expanded=True):
-                st.markdown("""
-                ## Adding Employee Data to Firebase
-                
-                1. Go to your [Firebase Console](https://console.firebase.google.com/)
-                2. Navigate to your project > Firestore Database
-                3. Create a collection named `employees`
-                4. Add employee documents with the following structure:
-                
-                ```json
-                {
-                  "name": "John Doe",
-                  "employee_number": "EMP123",
-                  "location": "London", 
-                  "rank": {
-                    "official_name": "Senior Consultant"
-                  },
-                  "skills": ["python", "machine learning", "aws"]
-                }
-                ```
-                
-                5. Create a separate collection named `availability`
-                6. Add availability documents with employee numbers as document IDs
-                7. For each availability document, create a subcollection named `weeks`
-                8. In each `weeks` subcollection, add documents for different weeks with the following structure:
-                
-                ```json
-                {
-                  "week_number": 1,
-                  "status": "available",
-                  "hours": 40,
-                  "notes": "Working on Project X"
-                }
-                ```
-                
-                For more details, see the Firebase Setup Guide.
-                """)
-                
-                st.warning("The application will not work correctly without proper employee and availability data in your database.")
-            
-    except Exception as e:
-        st.error(f"⚠️ Firebase connection failed: {str(e)}")
-        st.info("""
-        To connect to Firebase:
-        1. Make sure you have a valid Firebase project set up with Firestore.
-        2. Create a service account key JSON file in the Firebase console.
-        3. Save this file as 'firebase_credentials.json' in the project directory.
-        4. Or set the FIREBASE_CREDENTIALS_PATH environment variable to point to your credentials file.
-        
-        For detailed instructions, please refer to the FIREBASE_SETUP.md file.
-        """)
-        # Display the contents of the setup guide
+@st.cache_resource
+def get_firebase_client(credentials_path=None):
+    """Create the Firebase client once and share it across all sessions."""
+    # Imported here so firebase_admin is only loaded when the client is built
+    from src.firebase_utils import FirebaseClient
+    return FirebaseClient(credentials_path=credentials_path)
+
+@st.cache_resource
+def get_query_translator():
+    """Create the query translator once and share it across all sessions."""
+    from src.query_translator import QueryTranslator
+    return QueryTranslator()
+
+@st.cache_resource
+def get_response_generator(anthropic_api_key):
+    """Create the response generator once per API key and share it across all sessions."""
+    from src.response_generator import ResponseGenerator
+    return ResponseGenerator(anthropic_api_key=anthropic_api_key)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_verify(_client):
+    """Verify the Firebase setup, reusing the result across reruns and sessions."""
+    return _client.verify_firebase_setup()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_metadata(_client):
+    """Fetch resource metadata, sorted for display, reusing the result across reruns and sessions."""
+    metadata = _client.get_resource_metadata() or {}
+    return {key: sorted(values) for key, values in metadata.items()}
+
+def verify_setup(client):
+    """Verify the Firebase setup, keeping only a successful check in the cache."""
+    verification = _cached_verify(client)
+    if not (verification['employees_exist'] and verification['availability_exist']):
+        # Retry on the next rerun rather than serving the failure until the TTL expires
+        _cached_verify.clear()
+    return verification
+
+def load_metadata(client):
+    """Fetch resource metadata, keeping only a non-empty result in the cache."""
+    metadata = _cached_metadata(client)
+    if not any(metadata.values()):
+        # get_resource_metadata returns empty lists when the read fails
+        _cached_metadata.clear()
+    return metadata
+
+@st.cache_data
+def load_setup_guide() -> str:
+    """Read FIREBASE_SETUP.md from the working directory or next to this script."""
+    for path in ("FIREBASE_SETUP.md", os.path.join(_PROJECT_ROOT, "FIREBASE_SETUP.md")):
         try:
-            with open("FIREBASE_SETUP.md", "r") as f:
-                setup_guide = f.read()
+            with open(path, "r") as f:
+                return f.read()
         except FileNotFoundError:
-            # Try alternative paths
-            try:
-                import os
-                project_root = os.path.dirname(os.path.abspath(__file__))
-                with open(os.path.join(project_root, "FIREBASE_SETUP.md"), "r") as f:
-                    setup_guide = f.read()
-            except FileNotFoundError:
-                setup_guide = """
-                # Firebase Setup Guide
-                
-                Please create a firebase_credentials.json file with your Firebase service account credentials.
-                
-                1. Go to Firebase Console > Project Settings > Service Accounts
-                2. Click "Generate New Private Key"
-                3. Save as firebase_credentials.json in the project directory
-                """
+            continue
+    return """
+    # Firebase Setup Guide
+    
+    Please create a firebase_credentials.json file with your Firebase service account credentials.
+    
+    1. Go to Firebase Console > Project Settings > Service Accounts
+    2. Click "Generate New Private Key"
+    3. Save as firebase_credentials.json in the project directory
+    """
+
+# Connect to Firebase; the client is shared by every session in this process
+try:
+    firebase_client = get_firebase_client(get_firebase_creds_path())
+except Exception as e:
+    st.error(f"⚠️ Firebase connection failed: {str(e)}")
+    st.info("""
+    To connect to Firebase:
+    1. Make sure you have a valid Firebase project set up with Firestore.
+    2. Create a service account key JSON file in the Firebase console.
+    3. Save this file as 'firebase_credentials.json' in the project directory.
+    4. Or set the FIREBASE_CREDENTIALS_PATH environment variable to point to your credentials file.
+    
+    For detailed instructions, please refer to the FIREBASE_SETUP.md file.
+    """)
+    # Display the contents of the setup guide
+    with st.expander("Firebase Setup Guide", expanded=True):
+        st.markdown(load_setup_guide())
+    st.stop()  # Stop execution until Firebase is properly configured
+
+# Verify Firebase setup. On a cold cache the sidebar metadata is fetched on a
+# worker thread at the same time, so the two Firestore reads overlap.
+if firebase_client.is_connected:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(load_metadata, firebase_client)
+        verification = verify_setup(firebase_client)
+else:
+    verification = verify_setup(firebase_client)
+
+if verification['employees_exist'] and verification['availability_exist']:
+    pass  # Success message removed
+elif verification['employees_exist']:
+    st.warning(f"⚠️ {verification['message']}")
+    st.info("""
+    Your Firebase connection is working, and you have employees, but the availability data is missing or not structured correctly.
+    
+    You need to ensure proper availability data in your Firestore database for the application to work correctly.
+    """)
+else:
+    st.warning(f"⚠️ {verification['message']}")
+    st.info("""
+    Your Firebase connection is working, but there are no employees in the 'employees' collection.
+    
+    You need to add employee documents to your Firestore database for the application to work correctly.
+    """)
+    
+    with st.expander("How to Add Employee Data to Firebase", expanded=True):
+        st.markdown(_FIREBASE_SETUP_MD)
         
-        with st.expander("Firebase Setup Guide", expanded=True):
-            st.markdown(setup_guide)
-        st.stop()  # Stop execution until Firebase is properly configured
+        st.warning("The application will not work correctly without proper employee and availability data in your database.")
 
 def initialize_agent():
     """Initialize the agent with all required components."""
+    # LangGraph and LangChain are only needed once a session builds its agent
+    from src.master_agent import MasterAgent
+    from src.resource_fetcher import ResourceFetcher
+
     try:
         # Get API key from environment variables or Streamlit secrets
-        anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not anthropic_api_key and 'ANTHROPIC_API_KEY' in st.secrets:
-            anthropic_api_key = st.secrets['ANTHROPIC_API_KEY']
+        anthropic_api_key = get_api_key()
             
         if not anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment variables or Streamlit secrets")
         
         # Check Firebase connection
-        if not st.session_state.firebase_client or not st.session_state.firebase_client.is_connected:
+        if not firebase_client or not firebase_client.is_connected:
             raise ValueError("Firebase client is not connected")
 
-        # Initialize components
-        query_translator = QueryTranslator()
-        resource_fetcher = ResourceFetcher(st.session_state.firebase_client)
-        response_generator = ResponseGenerator(anthropic_api_key=anthropic_api_key)
+        # Shared, stateless components come from the process-wide cache
+        query_translator = get_query_translator()
+        response_generator = get_response_generator(anthropic_api_key)
+        # The fetcher and agent keep follow-up context, so they stay per session
+        resource_fetcher = ResourceFetcher(firebase_client)
         
         # Create master agent
         return MasterAgent(query_translator, resource_fetcher, response_generator)
@@ -173,15 +282,17 @@ def initialize_agent():
         st.error(f"Error initializing components: {str(e)}")
         return None
 
-# Initialize agent if not already done
+# Initialize agent if not already done. The agent stays per-session: MasterAgent
+# keeps last_query_context and ResourceFetcher keeps the last results for follow-up
+# questions, so sharing one instance would leak context between users. The
+# stateless collaborators it wraps are already shared via st.cache_resource.
 if st.session_state.agent is None:
     # Check Firebase connection first
-    if not st.session_state.firebase_client or not st.session_state.firebase_client.is_connected:
+    if not firebase_client or not firebase_client.is_connected:
         st.error("Cannot initialize agent: Firebase is not connected")
         st.info("Please set up your Firebase connection first")
     else:
-        # Check if resources exist
-        verification = st.session_state.firebase_client.verify_firebase_setup()
+        # Check if resources exist, reusing the verification from above
         if not verification['employees_exist']:
             st.error("Cannot initialize agent: No employees found in Firebase")
             st.info("Please add employees to your Firebase database first")
@@ -191,72 +302,123 @@ if st.session_state.agent is None:
 # Title and description
 st.title("🧞 Resource Genie")
 
-# Display chat messages from history on app rerun
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.markdown(message["content"])
+def is_truncated(content):
+    """Return True if a response is too long to render as markdown in full."""
+    return len(content) > _MARKDOWN_PREVIEW_CHARS
+
+def preview(content):
+    """Return content cut to the markdown preview length."""
+    return content[:_MARKDOWN_PREVIEW_CHARS] + "…" if is_truncated(content) else content
+
+def render_message(content, truncated=False, key=None):
+    """Render a chat message, previewing long content and using plain text for huge content."""
+    if len(content) > _MAX_MARKDOWN_CHARS:
+        st.text(content)
+    elif truncated:
+        # The full response is only sent once asked for; a collapsed expander
+        # would still send it with every rerun
+        if st.toggle("Show full response", key=key):
+            st.markdown(content)
+        else:
+            st.markdown(preview(content))
+    else:
+        st.markdown(content)
+
+def join_history(messages):
+    """Join chat messages into a single markdown string, one labelled, previewed section per message."""
+    return "\n\n---\n\n".join(
+        f"**{_ROLE_LABELS.get(message['role'], message['role'])}:**\n\n{preview(message['content'])}"
+        for message in messages
+    )
 
-# Accept user input
+@st.fragment
+def render_history():
+    """Render the chat history; showing earlier messages reruns only this fragment."""
+    # Display chat messages from history on app rerun. Only the most recent
+    # messages are rendered by default; older ones are sent on request.
+    messages = st.session_state.messages
+    hidden = max(len(messages) - _VISIBLE_HISTORY, 0)
+    if hidden:
+        if st.toggle(f"Show {hidden} earlier messages", key="show_earlier_messages"):
+            # Earlier history is read-only, so send it as one markdown block
+            # instead of a chat container per message
+            history = join_history(islice(messages, hidden))
+            if len(history) > _MAX_MARKDOWN_CHARS:
+                st.text(history)
+            else:
+                st.markdown(history)
+        messages = islice(messages, hidden, None)
+    for index, message in enumerate(messages, start=hidden):
+        with st.chat_message(message["role"]):
+            render_message(message["content"], message.get("truncated", False), key=f"show_full_{index}")
+
+render_history()
+
+# Accept user input. The input stays outside the fragment so Streamlit pins it
+# to the bottom of the page, below the history and the new turn.
 if prompt := st.chat_input("Ask about employees..."):
     # Add user message to chat history
     st.session_state.messages.append({"role": "user", "content": prompt})
-    
+
     # Display user message in chat message container
     with st.chat_message("user"):
         st.markdown(prompt)
 
     # Display assistant response in chat message container
     with st.chat_message("assistant"):
-        with st.spinner("Thinking..."):
-            try:
-                if st.session_state.agent:
-                    response = st.session_state.agent.process_message(prompt)
-                else:
-                    response = "Sorry, the agent is not properly initialized. Please check the system status in the sidebar."
-                st.markdown(response)
-            except Exception as e:
-                error_msg = f"Error processing query: {str(e)}"
-                st.error(error_msg)
-                response = f"I encountered an error: {str(e)}"
-                st.markdown(response)
-    
+        try:
+            if st.session_state.agent:
+                stream = st.session_state.agent.process_message_stream(prompt)
+                # The query is translated and resources fetched before the first
+                # chunk arrives, so the spinner covers only that wait
+                with st.spinner("Thinking..."):
+                    first_chunk = next(stream, "")
+                response = st.write_stream(chain([first_chunk], stream))
+                truncated = is_truncated(response)
+            else:
+                response = "Sorry, the agent is not properly initialized. Please check the system status in the sidebar."
+                truncated = is_truncated(response)
+                render_message(response, truncated)
+        except Exception as e:
+            error_msg = f"Error processing query: {str(e)}"
+            st.error(error_msg)
+            response = f"I encountered an error: {str(e)}"
+            truncated = is_truncated(response)
+            render_message(response, truncated)
+
     # Add assistant response to chat history
-    st.session_state.messages.append({"role": "assistant", "content": response})
+    st.session_state.messages.append({"role": "assistant", "content": response, "truncated": truncated})
+
+@st.fragment
+def render_sample_queries():
+    """Render the sample queries expander."""
+    with st.expander("📝 Sample Queries", expanded=False):
+        st.markdown(_SAMPLE_QUERIES_MD)
 
 # Sample queries in an expander
-with st.expander("📝 Sample Queries", expanded=False):
-    st.markdown("""
-    Try these example queries:
-    - "Find frontend developers in London"
-    - "Who are the consultants available in Week 3?"
-    - "Show me Solution Architects in Oslo"
-    - "Find employees with rank above consultant"
-    """)
+render_sample_queries()
 
-# Add information in the sidebar
-with st.sidebar:
+@st.fragment
+def render_sidebar(client):
+    """Render the About text and the resource metadata expanders."""
     st.title("About Resource Genie")
-    st.markdown("""
-    Resource Genie helps you find the right resources for your project.
-    
-    You can ask questions like:
-    - Find frontend developers in London
-    - Show me Senior Consultants with Python skills
-    - Who is available in Week 3?
-    - Find employees with React skills who are available next week
-    """)
+    st.markdown(_ABOUT_MD)
     
     # Add helpful resource information in expandable sections
-    if st.session_state.firebase_client and st.session_state.firebase_client.is_connected:
+    if client and client.is_connected:
+        # Metadata is cached for ten minutes; let users pick up new data sooner
+        if st.button("🔄 Refresh metadata", key="refresh_metadata"):
+            _cached_metadata.clear()
+        
         # Get resource metadata if available
         try:
-            metadata = st.session_state.firebase_client.get_resource_metadata()
+            metadata = load_metadata(client)
             
             # Show locations in an expander
             with st.expander("📍 Available Locations", expanded=False):
                 if metadata and 'locations' in metadata and metadata['locations']:
                     st.markdown("You can search for employees in these locations:")
-                    for location in sorted(metadata['locations']):
+                    for location in metadata['locations']:
                         st.markdown(f"- {location}")
                 else:
                     st.markdown("Location data is currently unavailable.")
@@ -266,7 +428,7 @@ with st.sidebar:
                 if metadata and 'skills' in metadata and metadata['skills']:
                     st.markdown("You can search for employees with these skills:")
                     # Display top skills (limit to prevent overwhelming)
-                    skills_to_show = sorted(metadata['skills'])[:15]
+                    skills_to_show = metadata['skills'][:15]
                     for skill in skills_to_show:
                         st.markdown(f"- {skill}")
                     if len(metadata['skills']) > 15:
@@ -278,12 +440,16 @@ with st.sidebar:
             with st.expander("🏅 Employee Ranks", expanded=False):
                 if metadata and 'ranks' in metadata and metadata['ranks']:
                     st.markdown("You can search for employees by these ranks:")
-                    for rank in sorted(metadata['ranks']):
+                    for rank in metadata['ranks']:
                         st.markdown(f"- {rank}")
                 else:
                     st.markdown("Rank data is currently unavailable.")
                     
         except Exception as e:
+            logger.warning("Resource metadata could not be loaded: %s", e)
             st.warning("Resource metadata could not be loaded.")
             # Don't show the full error to users
-    
\ No newline at end of file
+
+# Add information in the sidebar
+with st.sidebar:
+    render_sidebar(firebase_client)
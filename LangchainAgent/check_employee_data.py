@@ -1,80 +1,81 @@
-from src.firebase_utils import FirebaseClient
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from src.firebase_utils import get_client
+from src.query_cache import cached_count, cached_query
+
+logger = logging.getLogger(__name__)
 
 def main():
     # Initialize Firebase client
-    client = FirebaseClient()
+    client = get_client()
+    db = client.client
+    
+    # Existence checks use count() so no documents are downloaded; the samples
+    # that are printed below project only the printed fields.
+    in_london = ('location', '==', 'London')
+    is_partner = ('rank.official_name', '==', 'Partner')
+    
+    # The checks are independent, so run them concurrently and report the
+    # results in order once they have all arrived
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        sample_future = executor.submit(cached_query, db, 'employees', select=['name', 'location', 'rank'], limit=5)
+        # Served by the (location, rank.official_name) composite index in firestore.indexes.json
+        partners_count_future = executor.submit(cached_count, db, 'employees', [in_london, is_partner])
+        all_partners_count_future = executor.submit(cached_count, db, 'employees', [is_partner])
+        all_partners_future = executor.submit(cached_query, db, 'employees', [is_partner],
+                                              select=['name', 'location', 'rank'], limit=5)
+        london_count_future = executor.submit(cached_count, db, 'employees', [in_london])
+        london_future = executor.submit(cached_query, db, 'employees', [in_london], select=['name', 'rank'], limit=5)
     
-    print("Checking employee data structure...")
+    employees = sample_future.result()
+    partners_count = partners_count_future.result()
+    all_partners_count = all_partners_count_future.result()
+    all_partners = all_partners_future.result()
+    london_count = london_count_future.result()
+    london_employees = london_future.result()
     
-    # Get a few employee records
-    employees = client.client.collection('employees').limit(5).get()
+    logger.info("Checking employee data structure...")
     
-    print(f"Found {len(list(employees))} sample employees")
+    logger.info("Found %d sample employees", len(employees))
     
-    # Examine each employee's data structure
+    # Examine each employee's data structure, one log record per employee
     for emp in employees:
         data = emp.to_dict()
-        employee_id = emp.id
-        name = data.get('name', 'Unknown')
-        location = data.get('location', 'Unknown')
         rank = data.get('rank')
         
-        print(f"\nEmployee ID: {employee_id}")
-        print(f"Name: {name}")
-        print(f"Location: {location}")
-        print(f"Rank (raw): {rank}")
-        print(f"Rank type: {type(rank)}")
+        logger.info("\nEmployee ID: %s\nName: %s\nLocation: %s\nRank (raw): %s\nRank type: %s",
+                    emp.id, data.get('name', 'Unknown'), data.get('location', 'Unknown'), rank, type(rank))
         
         if isinstance(rank, dict):
-            print("Rank fields:")
-            for key, value in rank.items():
-                print(f"  - {key}: {value}")
+            logger.info("Rank fields:\n%s", "\n".join(f"  - {key}: {value}" for key, value in rank.items()))
     
     # Try a specific query for Partners in London
-    print("\nTesting query for Partners in London...")
-    partners_query = (client.client.collection('employees')
-                     .where('location', '==', 'London')
-                     .where('rank.official_name', '==', 'Partner')
-                     .limit(5))
-    
-    partners = partners_query.get()
-    partners_count = len(list(partners))
-    print(f"Found {partners_count} partners in London")
+    logger.info("\nTesting query for Partners in London...")
+    logger.info("Found %d partners in London", partners_count)
     
     # Check if any Partners exist anywhere
-    print("\nChecking for any Partners...")
-    all_partners_query = (client.client.collection('employees')
-                         .where('rank.official_name', '==', 'Partner')
-                         .limit(5))
-    
-    all_partners = all_partners_query.get()
-    all_partners_count = len(list(all_partners))
-    print(f"Found {all_partners_count} partners in total")
+    logger.info("\nChecking for any Partners...")
+    logger.info("Found %d partners in total", all_partners_count)
     
     if all_partners_count > 0:
-        print("\nSample Partner data:")
+        logger.info("\nSample Partner data:")
         for partner in all_partners:
             data = partner.to_dict()
-            print(f"Name: {data.get('name', 'Unknown')}")
-            print(f"Location: {data.get('location', 'Unknown')}")
-            print(f"Rank: {data.get('rank')}")
+            logger.info("Name: %s\nLocation: %s\nRank: %s",
+                        data.get('name', 'Unknown'), data.get('location', 'Unknown'), data.get('rank'))
     
     # Check if any employees exist in London
-    print("\nChecking for any employees in London...")
-    london_query = (client.client.collection('employees')
-                   .where('location', '==', 'London')
-                   .limit(5))
-    
-    london_employees = london_query.get()
-    london_count = len(list(london_employees))
-    print(f"Found {london_count} employees in London")
+    logger.info("\nChecking for any employees in London...")
+    logger.info("Found %d employees in London", london_count)
     
     if london_count > 0:
-        print("\nSample London employee data:")
+        logger.info("\nSample London employee data:")
         for emp in london_employees:
             data = emp.to_dict()
-            print(f"Name: {data.get('name', 'Unknown')}")
-            print(f"Rank: {data.get('rank')}")
+            logger.info("Name: %s\nRank: %s", data.get('name', 'Unknown'), data.get('rank'))
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(message)s")
+    main()
@@ -1,72 +1,70 @@
 #!/usr/bin/env python
-from src.firebase_utils import FirebaseClient
+import logging
+import os
+
+from src.firebase_utils import get_client
+from src.query_cache import cached_count, cached_query
+
+logger = logging.getLogger(__name__)
+
+# Lowercase spellings of frontend skills, matched against each employee's skills
+FRONTEND_TOKENS = frozenset({'frontend', 'front-end', 'front end', 'frontend developer', 'ui developer', 'front-end developer'})
 
 def main():
-    print("Connecting to Firebase...")
-    client = FirebaseClient()
+    logger.info("Connecting to Firebase...")
+    client = get_client()
+    db = client.client
     
     # Check if there are employees
-    print("\nChecking for employees...")
-    employees = client.client.collection('employees').limit(5).get()
-    employee_list = list(employees)
-    print(f"Found {len(employee_list)} employees")
+    logger.info("\nChecking for employees...")
+    employee_list = cached_query(db, 'employees', limit=5)
+    logger.info("Found %d employees", len(employee_list))
     
-    # Print details of each employee
+    # Print details of each employee, one log record per employee
     for doc in employee_list:
         emp = doc.to_dict()
-        print(f"\nEmployee: {emp.get('name')}")
-        print(f"Employee Number: {emp.get('employee_number')}")
-        print(f"Location: {emp.get('location')}")
-        print(f"Skills: {emp.get('skills', [])}")
-        print(f"Rank: {emp.get('rank', {}).get('official_name') if emp.get('rank') else 'Unknown'}")
+        rank = emp.get('rank')
+        logger.info("\nEmployee: %s\nEmployee Number: %s\nLocation: %s\nSkills: %s\nRank: %s",
+                    emp.get('name'), emp.get('employee_number'), emp.get('location'), emp.get('skills', []),
+                    rank.get('official_name') if rank else 'Unknown')
     
     # Check if there are any employees in London
-    print("\nChecking for employees in London...")
-    london_employees = client.client.collection('employees').where('location', '==', 'London').get()
-    london_list = list(london_employees)
-    print(f"Found {len(london_list)} employees in London")
+    logger.info("\nChecking for employees in London...")
+    london_count = cached_count(db, 'employees', [('location', '==', 'London')])
+    logger.info("Found %d employees in London", london_count)
     
-    # Check for employees with frontend-related skills using different potential variations
-    print("\nChecking for employees with frontend-related skills...")
-    frontend_variations = ['frontend', 'front-end', 'front end', 'frontend developer', 'ui developer', 'front-end developer']
+    # Check for employees with frontend-related skills using different potential variations.
+    # Skills are matched exactly by Firestore, so list the spellings stored in the database.
+    logger.info("\nChecking for employees with frontend-related skills...")
+    frontend_skills = sorted(FRONTEND_TOKENS) + ['Frontend', 'Front-end', 'Front End', 'Frontend Developer', 'UI Developer', 'Front-end Developer']
     
-    all_employees = client.client.collection('employees').get()
+    frontend_filter = ('skills', 'array_contains_any', frontend_skills)
     frontend_employees = []
     
-    for doc in all_employees:
+    for doc in cached_query(db, 'employees', [frontend_filter]):
         emp = doc.to_dict()
-        skills = [s.lower() for s in emp.get('skills', [])]
-        
-        # Check if any of the skill variations is in the skills list
-        matched_skills = []
-        for variation in frontend_variations:
-            for skill in skills:
-                if variation in skill:
-                    matched_skills.append(skill)
-        
-        if matched_skills:
-            emp['matched_skills'] = matched_skills
-            frontend_employees.append(emp)
+        emp['matched_skills'] = [skill for skill in emp.get('skills', []) if skill.lower() in FRONTEND_TOKENS]
+        frontend_employees.append(emp)
     
-    print(f"Found {len(frontend_employees)} employees with frontend-related skills")
+    logger.info("Found %d employees with frontend-related skills", len(frontend_employees))
     
     # Print details of employees with frontend skills
     for emp in frontend_employees:
-        print(f"\nEmployee: {emp.get('name')}")
-        print(f"Location: {emp.get('location')}")
-        print(f"Skills: {emp.get('skills', [])}")
-        print(f"Matched skills: {emp.get('matched_skills', [])}")
+        log_frontend_employee(emp)
     
     # Check specifically for employees in London with frontend-related skills
-    print("\nChecking for employees in London with frontend-related skills...")
+    logger.info("\nChecking for employees in London with frontend-related skills...")
     london_frontend_employees = [emp for emp in frontend_employees if emp.get('location') == 'London']
-    print(f"Found {len(london_frontend_employees)} employees in London with frontend-related skills")
+    logger.info("Found %d employees in London with frontend-related skills", len(london_frontend_employees))
     
     for emp in london_frontend_employees:
-        print(f"\nEmployee: {emp.get('name')}")
-        print(f"Location: {emp.get('location')}")
-        print(f"Skills: {emp.get('skills', [])}")
-        print(f"Matched skills: {emp.get('matched_skills', [])}")
+        log_frontend_employee(emp)
+
+def log_frontend_employee(emp):
+    """Log an employee's details along with the frontend skills they matched."""
+    logger.info("\nEmployee: %s\nLocation: %s\nSkills: %s\nMatched skills: %s",
+                emp.get('name'), emp.get('location'), emp.get('skills', []), emp.get('matched_skills', []))
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(message)s")
+    main()
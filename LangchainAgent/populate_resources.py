@@ -1,16 +1,22 @@
 #!/usr/bin/env python
-import os
 import random
 import json
 from dotenv import load_dotenv
 from collections import Counter
-import pandas as pd
-from src.firebase_utils import FirebaseClient
+from src.firebase_utils import get_client, paginate
+from src.query_cache import clear_cache
+
+# Firestore accepts at most 500 writes per batch commit
+BATCH_SIZE = 500
+
+def chunked(items, size):
+    """Split a list into consecutive chunks of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
 
 def initialize_firebase():
     """Initialize Firebase client"""
     try:
-        firebase_client = FirebaseClient()
+        firebase_client = get_client()
         print("Firebase initialized successfully.")
         return firebase_client
     except Exception as e:
@@ -57,23 +63,21 @@ def create_sample_resources(db, count=20):
     statuses = ["available", "partial", "unavailable"]
     
     created_resources = []
+    employees_to_write = []
     employee_numbers = []
     
     # Delete all existing employees and availability documents
     try:
-        # Delete employees
-        employees_ref = db.db.collection('employees')
-        employees = employees_ref.get()
-        for employee in employees:
+        # Delete employees, a page at a time so large collections are never loaded at once
+        employees_ref = db.client.collection('employees')
+        for employee in paginate(employees_ref):
             employee.reference.delete()
             
         # Delete availability
-        availability_ref = db.db.collection('availability')
-        availability_docs = availability_ref.get()
-        for doc in availability_docs:
+        availability_ref = db.client.collection('availability')
+        for doc in paginate(availability_ref):
             weeks_subcoll = doc.reference.collection('weeks')
-            weeks = weeks_subcoll.get()
-            for week in weeks:
+            for week in paginate(weeks_subcoll):
                 week.reference.delete()
             doc.reference.delete()
             
@@ -95,18 +99,26 @@ def create_sample_resources(db, count=20):
             "skills": random.sample(skills_pool, random.randint(3, 7))
         }
         
-        # Add employee to Firestore
+        employees_to_write.append(employee)
+    
+    # Add employees to Firestore in batched commits
+    employees_ref = db.client.collection('employees')
+    for chunk in chunked(employees_to_write, BATCH_SIZE):
+        batch = db.client.batch()
+        for employee in chunk:
+            batch.set(employees_ref.document(employee["employee_number"]), employee)
         try:
-            db.db.collection('employees').document(employee_number).set(employee)
-            created_resources.append(employee)
+            batch.commit()
+            created_resources.extend(chunk)
         except Exception as e:
-            print(f"Error adding employee {employee_number}: {str(e)}")
+            print(f"Error adding employees {chunk[0]['employee_number']}-{chunk[-1]['employee_number']}: {str(e)}")
     
     # Create availability data for each employee
+    availability_writes = []
     for employee_number in employee_numbers:
         # Create availability document
-        availability_ref = db.db.collection('availability').document(employee_number)
-        availability_ref.set({})  # Create empty document
+        availability_ref = db.client.collection('availability').document(employee_number)
+        availability_writes.append((availability_ref, {}))  # Create empty document
         
         # Create 4 weeks of availability data
         for week in range(1, 5):
@@ -125,10 +137,20 @@ def create_sample_resources(db, count=20):
             }
             
             # Add availability data to weeks subcollection
-            try:
-                availability_ref.collection('weeks').document(f"week{week}").set(week_data)
-            except Exception as e:
-                print(f"Error adding availability for {employee_number}, week {week}: {str(e)}")
+            availability_writes.append((availability_ref.collection('weeks').document(f"week{week}"), week_data))
+    
+    # Add availability data to Firestore in batched commits
+    for chunk in chunked(availability_writes, BATCH_SIZE):
+        batch = db.client.batch()
+        for doc_ref, data in chunk:
+            batch.set(doc_ref, data)
+        try:
+            batch.commit()
+        except Exception as e:
+            print(f"Error adding availability batch of {len(chunk)} documents: {str(e)}")
+    
+    # The diagnostic scripts' cached results describe the old data
+    clear_cache()
     
     print(f"Successfully created {len(created_resources)} employees with availability data")
     
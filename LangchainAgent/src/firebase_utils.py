@@ -5,12 +5,31 @@ Firebase utility module for handling Firebase operations.
 import os
 from typing import Optional, Dict, Any, List
 from firebase_admin import credentials, initialize_app, firestore, get_app
-import firebase_admin
 import json
 import datetime
 import streamlit as st
 import warnings
 
+# Map common skill terms to their actual representation in the database
+SKILL_MAPPING = {
+    'frontend': 'Frontend Developer',
+    'front-end': 'Frontend Developer',
+    'front end': 'Frontend Developer',
+    'ui': 'Frontend Developer',
+    'backend': 'Backend Developer',
+    'back-end': 'Backend Developer',
+    'back end': 'Backend Developer',
+    'fullstack': 'Full Stack Developer',
+    'full-stack': 'Full Stack Developer',
+    'full stack': 'Full Stack Developer',
+    'product': 'Product Manager',
+    'project': 'Project Manager',
+    'agile': 'Agile Coach',
+    'scrum': 'Scrum Master',
+    'data': 'Data Engineer',
+    'cloud': 'Cloud Engineer'
+}
+
 class FirebaseClient:
     """
     Firebase client utility for managing Firebase operations.
@@ -593,7 +612,8 @@ class FirebaseClient:
             
             # Get a reference to the employees collection
             employees_ref = self.client.collection('employees')
-            employees = employees_ref.limit(100).stream()  # Limit to prevent large data loads
+            # Only the fields summarised below are read, so project them server-side
+            employees = employees_ref.select(['location', 'skills', 'rank.official_name']).limit(100).stream()  # Limit to prevent large data loads
             
             # Collect metadata from employees
             for employee in employees:
@@ -699,32 +719,12 @@ class FirebaseClient:
                     if not isinstance(skills, list):
                         skills = [skills]
                     
-                    # Map common skill terms to their actual representation in the database
-                    skill_mapping = {
-                        'frontend': 'Frontend Developer',
-                        'front-end': 'Frontend Developer',
-                        'front end': 'Frontend Developer',
-                        'ui': 'Frontend Developer',
-                        'backend': 'Backend Developer',
-                        'back-end': 'Backend Developer',
-                        'back end': 'Backend Developer',
-                        'fullstack': 'Full Stack Developer',
-                        'full-stack': 'Full Stack Developer',
-                        'full stack': 'Full Stack Developer',
-                        'product': 'Product Manager',
-                        'project': 'Project Manager',
-                        'agile': 'Agile Coach',
-                        'scrum': 'Scrum Master',
-                        'data': 'Data Engineer',
-                        'cloud': 'Cloud Engineer'
-                    }
-                    
                     # Transform skill queries to match database entries
                     transformed_skills = []
                     for skill in skills:
                         skill_lower = skill.lower()
-                        if skill_lower in skill_mapping:
-                            transformed_skills.append(skill_mapping[skill_lower])
+                        if skill_lower in SKILL_MAPPING:
+                            transformed_skills.append(SKILL_MAPPING[skill_lower])
                         else:
                             # If no mapping exists, leave it as is
                             transformed_skills.append(skill)
@@ -759,6 +759,7 @@ class FirebaseClient:
                 print(f"Applying post-query rank filtering for {len(ranks)} ranks")
                 # Check each employee has one of the required ranks
                 filtered_employees = []
+                requested_ranks = {rank.lower() for rank in ranks}
                 
                 for employee in employee_list:
                     rank_data = employee.get('rank', {})
@@ -769,7 +770,7 @@ class FirebaseClient:
                     official_name = rank_data.get('official_name', '')
                     
                     # Check if the employee's rank matches any of the requested ranks
-                    if any(rank.lower() == official_name.lower() for rank in ranks):
+                    if official_name.lower() in requested_ranks:
                         filtered_employees.append(employee)
                 
                 print(f"After rank filtering: {len(filtered_employees)}/{len(employee_list)} employees remain")
@@ -838,10 +839,11 @@ class FirebaseClient:
             if skills and len(skills) > 1:
                 print(f"Applying additional skills filtering for {len(skills)} skills")
                 # Check each employee has all the required skills
+                required_skills = {skill.lower() for skill in skills}
                 filtered_employees = []
                 for employee in employee_list:
-                    emp_skills = [s.lower() for s in employee.get('skills', [])]
-                    all_skills_match = all(skill.lower() in emp_skills for skill in skills)
+                    emp_skills = {s.lower() for s in employee.get('skills', [])}
+                    all_skills_match = required_skills <= emp_skills
                     if all_skills_match:
                         filtered_employees.append(employee)
                 print(f"After skills filtering: {len(filtered_employees)}/{len(employee_list)} employees remain")
@@ -1010,4 +1012,50 @@ class FirebaseClient:
             
         except Exception as e:
             print(f"Error fetching availability batch: {str(e)}")
-            return {} 
\ No newline at end of file
+            return {}
+
+def paginate(query, page_size: int = 500):
+    """
+    Yield every document matching a query, fetching it in pages.
+    
+    Pages are chained with start_after on the last document rather than
+    offset(), which Firestore bills for every skipped document.
+    
+    Args:
+        query: A Firestore Query or CollectionReference
+        page_size: Number of documents to fetch per request
+        
+    Yields:
+        DocumentSnapshot objects in query order
+    """
+    last_doc = None
+    while True:
+        page_query = query.limit(page_size)
+        if last_doc is not None:
+            page_query = page_query.start_after(last_doc)
+        
+        page = list(page_query.stream())
+        yield from page
+        
+        if len(page) < page_size:
+            return
+        last_doc = page[-1]
+
+# Shared client for scripts that run several checks in one process
+_client = None
+
+def get_client(credentials_path: Optional[str] = None) -> FirebaseClient:
+    """
+    Return a process-wide FirebaseClient, creating it on first use.
+    
+    Args:
+        credentials_path: Path to Firebase credentials JSON file, used only
+                          when the client is first created
+        
+    Returns:
+        The shared FirebaseClient instance
+    """
+    global _client
+    if _client is None:
+        _client = FirebaseClient(credentials_path=credentials_path)
+    return _client
@@ -210,63 +210,113 @@ class MasterAgent:
             Generated response
         """
         try:
-            if debug:
-                print(f"\n===== MASTER AGENT: Starting to process message: {message} =====")
+            query_translation, resources = self._translate_and_fetch(message, debug)
             
-            # Step 1: Translate the query, using previous context if available
+            # Step 3: Generate response
             if debug:
-                print("\n----- QUERY TRANSLATOR: Translating query -----")
-                if self.last_query_context:
-                    print(f"Using previous context: {self.last_query_context}")
-            
-            query_translation = self.query_translator.translate(message, context=self.last_query_context)
+                print("\n----- RESPONSE GENERATOR: Generating response -----")
+                print(f"Input: Query='{message}', Resources={len(resources)} items")
             
-            # Store the current translation for future follow-up queries
-            self.last_query_context = query_translation
+            response = self.response_generator.generate(
+                results=resources,
+                query=query_translation,
+                original_question=message
+            )
             
             if debug:
-                print(f"Translated query result: {query_translation}")
+                print(f"Generated response: {response[:100]}... (truncated)" if response and len(response) > 100 else f"Generated response: {response}")
+                print("\n===== MASTER AGENT: Processing complete =====")
             
-            # Step 2: Fetch resources
-            if debug:
-                print("\n----- RESOURCE FETCHER: Fetching resources -----")
-                print(f"Input filters: {query_translation}")
+            return response
             
-            resource_result = self.resource_fetcher.fetch_resources(query_dict=query_translation)
-            resources = resource_result.get("employees", [])
+        except Exception as e:
+            error_msg = f"Error processing message: {str(e)}"
+            print(f"ERROR: {error_msg}")
+            import traceback
+            traceback.print_exc()
+            return f"I encountered an error: {error_msg}"
+    
+    def process_message_stream(self, message: str, debug=False):
+        """
+        Process a user message and stream the generated response.
+        
+        Args:
+            message: User message to process
+            debug: Whether to print debug information
             
-            if debug:
-                print(f"Found {len(resources)} resources")
-                for i, res in enumerate(resources[:3] if len(resources) >= 3 else resources):  # Print first 3 for brevity
-                    print(f"Resource {i+1}: {res.get('name', 'Unknown')} - {res.get('employee_number', 'No ID')}")
-                if len(resources) > 3:
-                    print(f"... and {len(resources) - 3} more")
-                if "error" in resource_result:
-                    print(f"Error in resource fetching: {resource_result.get('error')}")
+        Yields:
+            Chunks of the generated response
+        """
+        try:
+            query_translation, resources = self._translate_and_fetch(message, debug)
             
-            # Step 3: Generate response
+            # Step 3: Stream response
             if debug:
-                print("\n----- RESPONSE GENERATOR: Generating response -----")
+                print("\n----- RESPONSE GENERATOR: Streaming response -----")
                 print(f"Input: Query='{message}', Resources={len(resources)} items")
             
-            response = self.response_generator.generate(
+            yield from self.response_generator.generate_stream(
                 results=resources,
                 query=query_translation,
                 original_question=message
             )
             
             if debug:
-                print(f"Generated response: {response[:100]}... (truncated)" if response and len(response) > 100 else f"Generated response: {response}")
                 print("\n===== MASTER AGENT: Processing complete =====")
             
-            return response
-            
         except Exception as e:
             error_msg = f"Error processing message: {str(e)}"
             print(f"ERROR: {error_msg}")
             import traceback
             traceback.print_exc()
-            return f"I encountered an error: {error_msg}"
+            yield f"I encountered an error: {error_msg}"
+    
+    def _translate_and_fetch(self, message: str, debug=False):
+        """
+        Translate a user message and fetch the matching resources.
+        
+        Args:
+            message: User message to process
+            debug: Whether to print debug information
+            
+        Returns:
+            Tuple of the structured query and the list of matching resources
+        """
+        if debug:
+            print(f"\n===== MASTER AGENT: Starting to process message: {message} =====")
+        
+        # Step 1: Translate the query, using previous context if available
+        if debug:
+            print("\n----- QUERY TRANSLATOR: Translating query -----")
+            if self.last_query_context:
+                print(f"Using previous context: {self.last_query_context}")
+        
+        query_translation = self.query_translator.translate(message, context=self.last_query_context)
+        
+        # Store the current translation for future follow-up queries
+        self.last_query_context = query_translation
+        
+        if debug:
+            print(f"Translated query result: {query_translation}")
+        
+        # Step 2: Fetch resources
+        if debug:
+            print("\n----- RESOURCE FETCHER: Fetching resources -----")
+            print(f"Input filters: {query_translation}")
+        
+        resource_result = self.resource_fetcher.fetch_resources(query_dict=query_translation)
+        resources = resource_result.get("employees", [])
+        
+        if debug:
+            print(f"Found {len(resources)} resources")
+            for i, res in enumerate(resources[:3] if len(resources) >= 3 else resources):  # Print first 3 for brevity
+                print(f"Resource {i+1}: {res.get('name', 'Unknown')} - {res.get('employee_number', 'No ID')}")
+            if len(resources) > 3:
+                print(f"... and {len(resources) - 3} more")
+            if "error" in resource_result:
+                print(f"Error in resource fetching: {resource_result.get('error')}")
+        
+        return query_translation, resources
     
     def update_plan(self, message: str, response: str):
         """
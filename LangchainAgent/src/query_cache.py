@@ -0,0 +1,169 @@
+"""
+On-disk cache of Firestore query results for the diagnostic scripts.
+
+Results are stored under ~/.cache/genie-firestore, keyed on the collection,
+where conditions, projection and limit, and reused for an hour. Set
+GENIE_QUERY_CACHE=0 to always query Firestore. populate_resources.py clears
+the cache after it rewrites the data.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "genie-firestore")
+CACHE_TTL_SECONDS = 3600
+
+# Returned by _load when there is no usable cache entry
+_MISS = object()
+
+class CachedDocument:
+    """
+    Minimal stand-in for a Firestore DocumentSnapshot.
+
+    Exposes the id and to_dict() used by the scripts, so cached and live
+    results can be handled the same way.
+    """
+
+    def __init__(self, doc_id: str, data: Dict[str, Any]):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._data)
+
+def _cache_enabled() -> bool:
+    return os.getenv("GENIE_QUERY_CACHE", "1").lower() not in ("0", "false", "no")
+
+def _cache_path(kind: str, db, collection: str, where: Sequence[Tuple[str, str, Any]],
+                select: Optional[List[str]] = None, limit: Optional[int] = None) -> str:
+    """Build the cache file path from the query description the caller passed in."""
+    description = [kind, db.project, collection, [list(condition) for condition in where], select, limit]
+    key = hashlib.sha256(json.dumps(description, sort_keys=True, default=str).encode())
+    return os.path.join(CACHE_DIR, f"{key.hexdigest()}.pkl")
+
+def _build_query(db, collection: str, where: Sequence[Tuple[str, str, Any]] = (),
+                select: Optional[List[str]] = None, limit: Optional[int] = None):
+    """
+    Build a Firestore query from a collection name, where tuples, projection and limit.
+
+    Args:
+        db: A Firestore client
+        collection: Name of the collection to query
+        where: (field, operator, value) conditions, all of which must match
+        select: Field paths to project, or None for whole documents
+        limit: Maximum number of documents, or None for no limit
+
+    Returns:
+        A Firestore Query
+    """
+    query = db.collection(collection)
+    for field, op, value in where:
+        query = query.where(field, op, value)
+    if select is not None:
+        query = query.select(select)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+def _load(path: str) -> Any:
+    """Return a fresh cached value from path, or _MISS."""
+    try:
+        age = time.time() - os.path.getmtime(path)
+        if age < CACHE_TTL_SECONDS:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            logger.info("(using cached Firestore results from %d minutes ago; set GENIE_QUERY_CACHE=0 to bypass)",
+                        age // 60)
+            return value
+    except OSError:
+        pass  # Missing or unreadable cache entry; query Firestore instead
+    except Exception as e:
+        # Unpickling a damaged entry can raise almost anything; query Firestore instead
+        logger.warning("Ignoring damaged cache entry %s: %s", path, e)
+    return _MISS
+
+def _store(path: str, value: Any) -> None:
+    """Write value to path without ever exposing a partial entry."""
+    # Write to a temporary file first so a concurrent reader never sees a partial entry
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PickleError, TypeError, AttributeError) as e:
+        logger.warning("Could not cache query results: %s", e)
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def cached_query(db, collection: str, where: Sequence[Tuple[str, str, Any]] = (),
+                 select: Optional[List[str]] = None, limit: Optional[int] = None) -> List[CachedDocument]:
+    """
+    Run a Firestore query, reusing a recent on-disk result when one exists.
+
+    Args:
+        db: A Firestore client
+        collection: Name of the collection to query
+        where: (field, operator, value) conditions, all of which must match
+        select: Field paths to project, or None for whole documents
+        limit: Maximum number of documents, or None for no limit
+
+    Returns:
+        List of CachedDocument objects in query order
+    """
+    query = _build_query(db, collection, where, select, limit)
+    if not _cache_enabled():
+        return [CachedDocument(doc.id, doc.to_dict()) for doc in query.stream()]
+
+    path = _cache_path("docs", db, collection, where, select, limit)
+    records = _load(path)
+    if records is _MISS:
+        records = [(doc.id, doc.to_dict()) for doc in query.stream()]
+        _store(path, records)
+
+    return [CachedDocument(doc_id, data) for doc_id, data in records]
+
+def cached_count(db, collection: str, where: Sequence[Tuple[str, str, Any]] = ()) -> int:
+    """
+    Count the documents matching a query with a server-side count aggregation,
+    reusing a recent on-disk result when one exists.
+
+    Counts go through the same cache as cached_query, so a report never mixes
+    live counts with older sample documents.
+
+    Args:
+        db: A Firestore client
+        collection: Name of the collection to query
+        where: (field, operator, value) conditions, all of which must match
+
+    Returns:
+        Number of matching documents
+    """
+    query = _build_query(db, collection, where)
+    if not _cache_enabled():
+        return query.count().get()[0][0].value
+
+    path = _cache_path("count", db, collection, where)
+    count = _load(path)
+    if count is _MISS:
+        count = query.count().get()[0][0].value
+        _store(path, count)
+    return count
+
+def clear_cache() -> None:
+    """Remove every cached query result, e.g. after the data has been rewritten."""
+    for path in glob.glob(os.path.join(CACHE_DIR, "*.pkl")):
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning("Could not remove cached query results %s: %s", path, e)
@@ -1,9 +1,19 @@
 import json
 import os
-from typing import Dict, List, Optional, Any
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any
 
 from anthropic import Anthropic
 
+# JSON extraction patterns for LLM responses, compiled once at import
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*({[\s\S]*?})\s*```')
+_JSON_OBJECT_RE = re.compile(r'{[\s\S]*?}')
+
+# Maximum number of LLM completions kept by each translator, keyed on prompt
+_TRANSLATION_CACHE_SIZE = 256
+
 class QueryTranslator:
     """
     Translates natural language queries into structured queries for resource management.
@@ -58,6 +68,12 @@ class QueryTranslator:
             self.client = Anthropic(api_key=self.api_key)
         except Exception as e:
             raise ValueError(f"Failed to initialize Anthropic client: {str(e)}")
+
+        # LRU cache of raw LLM completions keyed on the full prompt. The prompt
+        # already embeds the query and any follow-up context, so a repeated
+        # question in the same context skips the API round trip.
+        self._translation_cache = OrderedDict()
+        self._translation_cache_lock = threading.Lock()
     
     def translate(self, query: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -90,17 +106,10 @@ class QueryTranslator:
             prompt = self._create_prompt(query, context if is_followup else None)
             
             # Get completion from Claude
-            response = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=1000,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+            response_text = self._complete(prompt)
             
             # Extract and parse the structured query
-            result = self._parse_response(response.content[0].text)
+            result = self._parse_response(response_text)
             print(f"Initial parsed result: {result}")
             
             # If this is a follow-up query and we have context, determine how to merge with context
@@ -154,6 +163,31 @@ class QueryTranslator:
         except Exception as e:
             raise ValueError(f"Translation failed: {str(e)}")
     
+    def _complete(self, prompt: str) -> str:
+        """Return the LLM completion for a prompt, reusing cached completions."""
+        with self._translation_cache_lock:
+            if prompt in self._translation_cache:
+                self._translation_cache.move_to_end(prompt)
+                print("Using cached translation")
+                return self._translation_cache[prompt]
+        
+        response = self.client.messages.create(
+            model="claude-sonnet-4-5-20250929",
+            max_tokens=1000,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        )
+        text = response.content[0].text
+        
+        with self._translation_cache_lock:
+            self._translation_cache[prompt] = text
+            self._translation_cache.move_to_end(prompt)
+            while len(self._translation_cache) > _TRANSLATION_CACHE_SIZE:
+                self._translation_cache.popitem(last=False)
+        return text
+    
     def _create_prompt(self, query: str, context: Optional[Dict[str, Any]] = None) -> str:
         """Create the prompt for the LLM."""
         # Use raw string for the entire prompt except for the query variable
@@ -257,10 +291,8 @@ Examples of different follow-up types:
             print(f"Raw LLM response: {response}")
             
             # First, try to find JSON block in the response using regex
-            import re
-            
             # Look for JSON with or without the code block markers
-            json_match = re.search(r'```(?:json)?\s*({[\s\S]*?})\s*```', response)
+            json_match = _JSON_BLOCK_RE.search(response)
             if json_match:
                 try:
                     json_str = json_match.group(1)
@@ -270,7 +302,7 @@ Examples of different follow-up types:
                     print(f"JSON decode error: {e}, trying alternate methods")
             
             # If no JSON block found, try to find any JSON object in the text
-            json_match = re.search(r'{[\s\S]*?}', response)
+            json_match = _JSON_OBJECT_RE.search(response)
             if json_match:
                 try:
                     json_str = json_match.group(0)
@@ -282,13 +314,14 @@ Examples of different follow-up types:
             # If still no JSON found, manually parse the response
             print("No JSON found, manually parsing response")
             structured = {}
+            response_lower = response.lower()
             
             # Check for mentions of "partner" and "nordic"/"nordics" directly in the response
-            if "partner" in response.lower() or "partners" in response.lower():
+            if "partner" in response_lower or "partners" in response_lower:
                 structured["ranks"] = ["Partner"]
                 print("Manually added Partner rank")
             
-            if "nordic" in response.lower() or "nordics" in response.lower() or "oslo" in response.lower() or "stockholm" in response.lower() or "copenhagen" in response.lower():
+            if "nordic" in response_lower or "nordics" in response_lower or "oslo" in response_lower or "stockholm" in response_lower or "copenhagen" in response_lower:
                 structured["locations"] = ["Nordics"]  
                 print("Manually added Nordics location")
             
@@ -298,9 +331,10 @@ Examples of different follow-up types:
             
             for line in lines:
                 line = line.strip()
+                line_lower = line.lower()
                 
                 # Check for field headers
-                if "location" in line.lower() and ":" in line:
+                if "location" in line_lower and ":" in line:
                     current_field = 'locations'
                     structured['locations'] = []
                     
@@ -312,7 +346,7 @@ Examples of different follow-up types:
                         values_list = [v.strip() for v in values.split(',')]
                         structured['locations'] = values_list
                         
-                elif "skill" in line.lower() and ":" in line:
+                elif "skill" in line_lower and ":" in line:
                     current_field = 'skills'
                     structured['skills'] = []
                     
@@ -324,7 +358,7 @@ Examples of different follow-up types:
                         values_list = [v.strip() for v in values.split(',')]
                         structured['skills'] = values_list
                         
-                elif "rank" in line.lower() and ":" in line:
+                elif "rank" in line_lower and ":" in line:
                     current_field = 'ranks'
                     structured['ranks'] = []
                     
@@ -336,7 +370,7 @@ Examples of different follow-up types:
                         values_list = [v.strip() for v in values.split(',')]
                         structured['ranks'] = values_list
                         
-                elif "week" in line.lower() and ":" in line:
+                elif "week" in line_lower and ":" in line:
                     current_field = 'weeks'
                     structured['weeks'] = []
                     
@@ -358,11 +392,11 @@ Examples of different follow-up types:
                         structured[current_field].append(item)
             
             # Final check: if the query has keywords but we still have an empty result, add defaults
-            if not structured and ("partners" in response.lower() or "nordics" in response.lower()):
-                if "partner" in response.lower() or "partners" in response.lower():
+            if not structured and ("partners" in response_lower or "nordics" in response_lower):
+                if "partner" in response_lower or "partners" in response_lower:
                     structured["ranks"] = ["Partner"]
                 
-                if "nordic" in response.lower() or "nordics" in response.lower() or "copenhagen" in response.lower():
+                if "nordic" in response_lower or "nordics" in response_lower or "copenhagen" in response_lower:
                     structured["locations"] = ["Nordics"]
             
             return structured
@@ -370,12 +404,13 @@ Examples of different follow-up types:
         except Exception as e:
             print(f"Error parsing response: {str(e)}")
             # Emergency fallback for common queries
-            if "partner" in response.lower() and ("nordic" in response.lower() or "nordics" in response.lower()):
+            response_lower = response.lower()
+            if "partner" in response_lower and ("nordic" in response_lower or "nordics" in response_lower):
                 return {
                     "locations": ["Nordics"],
                     "ranks": ["Partner"]
                 }
-            if "frontend" in response.lower() and "london" in response.lower():
+            if "frontend" in response_lower and "london" in response_lower:
                 return {
                     "locations": ["London"],
                     "skills": ["frontend"]
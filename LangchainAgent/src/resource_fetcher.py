@@ -3,8 +3,7 @@ Resource Fetcher module for retrieving resources from Firebase based on structur
 """
 
 import logging
-from typing import Dict, List, Optional, Any, Union, Set
-import json
+from typing import Dict, List, Optional, Any
 
 from src.firebase_utils import FirebaseClient
 
@@ -2,7 +2,7 @@
 Response Generator module for creating human-friendly responses about employee availability.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Tuple
 import anthropic
 
 class ResponseGenerator:
@@ -32,6 +32,42 @@ class ResponseGenerator:
         Returns:
             A human-friendly response string
         """
+        system_prompt, messages = self._build_request(results, query, original_question)
+        
+        # Get response from Claude
+        response = self.client.messages.create(
+            model="claude-sonnet-4-5-20250929",
+            max_tokens=1000,
+            system=system_prompt,
+            messages=messages
+        )
+        
+        return response.content[0].text
+    
+    def generate_stream(self, results: List[Dict[str, Any]], query: Dict[str, Any], original_question: str) -> Iterator[str]:
+        """
+        Generate the same response as generate(), yielding text as the LLM produces it.
+        
+        Args:
+            results: List of matching employees with their details
+            query: Dictionary containing the structured query parameters
+            original_question: The original natural language question asked by the user
+            
+        Yields:
+            Chunks of the response text
+        """
+        system_prompt, messages = self._build_request(results, query, original_question)
+        
+        with self.client.messages.stream(
+            model="claude-sonnet-4-5-20250929",
+            max_tokens=1000,
+            system=system_prompt,
+            messages=messages
+        ) as stream:
+            yield from stream.text_stream
+    
+    def _build_request(self, results: List[Dict[str, Any]], query: Dict[str, Any], original_question: str) -> Tuple[str, List[Dict[str, str]]]:
+        """Build the system prompt and messages for a response request."""
         # Prepare the system prompt
         system_prompt = """You are a helpful resource manager assistant who helps find and suggest the right employees for projects.
 Your task is to analyze the search results and original question, then provide a clear, human-friendly response that:
@@ -72,15 +108,7 @@ Please provide a helpful response that addresses the original question and provi
             }
         ]
         
-        # Get response from Claude
-        response = self.client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=1000,
-            system=system_prompt,
-            messages=messages
-        )
-        
-        return response.content[0].text
+        return system_prompt, messages
     
     def _format_query_context(self, query: Dict[str, Any]) -> str:
         """Format the query parameters into a readable string."""
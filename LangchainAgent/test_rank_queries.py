@@ -12,7 +12,7 @@ rank hierarchies, specifically:
 import json
 import os
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any
 
 from src.query_translator import QueryTranslator
 
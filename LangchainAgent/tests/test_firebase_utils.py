@@ -0,0 +1,55 @@
+import unittest
+
+from src.firebase_utils import paginate
+
+class FakeQuery:
+    """In-memory stand-in for a Firestore query supporting limit, start_after and stream."""
+
+    def __init__(self, docs, requests, start=0, page_size=None):
+        self.docs = docs
+        self.requests = requests
+        self.start = start
+        self.page_size = page_size
+
+    def limit(self, page_size):
+        return FakeQuery(self.docs, self.requests, self.start, page_size)
+
+    def start_after(self, doc):
+        return FakeQuery(self.docs, self.requests, self.docs.index(doc) + 1, self.page_size)
+
+    def stream(self):
+        self.requests.append(self.start)
+        return iter(self.docs[self.start:self.start + self.page_size])
+
+class TestPaginate(unittest.TestCase):
+    """Test cases for the paginate helper."""
+
+    def paginate_docs(self, count, page_size=3):
+        """Paginate over count fake documents, returning the results and the page start offsets requested."""
+        docs = [f"doc{i}" for i in range(count)]
+        requests = []
+        return list(paginate(FakeQuery(docs, requests), page_size=page_size)), docs, requests
+
+    def test_paginate_empty_result(self):
+        """Test that an empty query yields nothing after a single request."""
+        result, _, requests = self.paginate_docs(0)
+
+        self.assertEqual(result, [])
+        self.assertEqual(requests, [0])
+
+    def test_paginate_exact_multiple_of_page_size(self):
+        """Test that a full last page is followed by one empty request and no duplicates."""
+        result, docs, requests = self.paginate_docs(6)
+
+        self.assertEqual(result, docs)
+        self.assertEqual(requests, [0, 3, 6])
+
+    def test_paginate_partial_last_page(self):
+        """Test that a short last page ends pagination without another request."""
+        result, docs, requests = self.paginate_docs(7)
+
+        self.assertEqual(result, docs)
+        self.assertEqual(requests, [0, 3, 6])
+
+if __name__ == '__main__':
+    unittest.main()
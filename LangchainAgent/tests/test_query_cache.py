@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src import query_cache
+
+class TestQueryCache(unittest.TestCase):
+    """Test cases for the on-disk query cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cache_dir = tempfile.mkdtemp()
+        patcher = patch.object(query_cache, "CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+
+        self.doc = MagicMock()
+        self.doc.id = "EMP001"
+        self.doc.to_dict.return_value = {"name": "John Doe", "location": "London"}
+
+        # Every query builder method returns the same query, which streams one document
+        self.query = MagicMock()
+        self.query.where.return_value = self.query
+        self.query.select.return_value = self.query
+        self.query.limit.return_value = self.query
+        self.query.stream.side_effect = lambda *a, **k: iter([self.doc])
+        self.query.count.return_value.get.return_value = [[MagicMock(value=3)]]
+
+        self.db = MagicMock()
+        self.db.project = "test-project"
+        self.db.collection.return_value = self.query
+
+    def test_query_cache_reuses_results(self):
+        """Test that a repeated query is served from disk."""
+        first = query_cache.cached_query(self.db, "employees", [("location", "==", "London")], limit=5)
+        second = query_cache.cached_query(self.db, "employees", [("location", "==", "London")], limit=5)
+        query_cache.cached_query(self.db, "employees", [("location", "==", "Oslo")], limit=5)
+
+        self.assertEqual(self.query.stream.call_count, 2)
+        self.query.where.assert_called_with("location", "==", "Oslo")
+        self.query.limit.assert_called_with(5)
+        self.assertEqual(second[0].id, "EMP001")
+        self.assertEqual(second[0].to_dict(), first[0].to_dict())
+
+    def test_query_cache_can_be_disabled(self):
+        """Test that GENIE_QUERY_CACHE=0 always queries Firestore."""
+        with patch.dict(os.environ, {"GENIE_QUERY_CACHE": "0"}):
+            query_cache.cached_query(self.db, "employees", limit=5)
+            query_cache.cached_query(self.db, "employees", limit=5)
+
+        self.assertEqual(self.query.stream.call_count, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_query_cache_counts_and_logs_hits(self):
+        """Test that counts are cached separately from documents and hits are logged."""
+        where = [("location", "==", "London")]
+
+        self.assertEqual(query_cache.cached_count(self.db, "employees", where), 3)
+        with self.assertLogs(query_cache.logger, level="INFO") as logs:
+            self.assertEqual(query_cache.cached_count(self.db, "employees", where), 3)
+        self.assertEqual(query_cache.cached_query(self.db, "employees", where)[0].id, "EMP001")
+
+        self.assertEqual(self.query.count.call_count, 1)
+        self.assertEqual(self.query.stream.call_count, 1)
+        self.assertIn("cached Firestore results", logs.output[0])
+
+    def test_clear_cache_removes_entries(self):
+        """Test that clear_cache forces the next query to hit Firestore."""
+        query_cache.cached_query(self.db, "employees", limit=5)
+        query_cache.clear_cache()
+        query_cache.cached_query(self.db, "employees", limit=5)
+
+        self.assertEqual(self.query.stream.call_count, 2)
+
+    def test_damaged_entry_falls_back_to_firestore(self):
+        """Test that an entry that fails to unpickle is ignored rather than raised."""
+        query_cache.cached_query(self.db, "employees", limit=5)
+        [entry] = os.listdir(self.cache_dir)
+        # A pickle that references a missing module raises ModuleNotFoundError on load
+        with open(os.path.join(self.cache_dir, entry), "wb") as f:
+            f.write(b"cno_such_module\nthing\n.")
+
+        with self.assertLogs(query_cache.logger, level="WARNING"):
+            result = query_cache.cached_query(self.db, "employees", limit=5)
+
+        self.assertEqual(result[0].id, "EMP001")
+        self.assertEqual(self.query.stream.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
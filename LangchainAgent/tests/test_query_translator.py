@@ -124,5 +124,22 @@ class TestQueryTranslator(unittest.TestCase):
         self.assertEqual(result["rank"], "Senior Consultant")
         self.assertEqual(result["availability"], [2])
 
+    def test_query_translator_caches_repeated_queries(self):
+        """Test that repeating a query reuses the cached LLM completion."""
+        completion = MagicMock()
+        completion.content = [MagicMock(text='{"locations": ["London"], "skills": ["Frontend Developer"]}')]
+        self.translator.client = MagicMock()
+        self.translator.client.messages.create.return_value = completion
+        
+        first = self.translator.translate("Find frontend developers in London")
+        first["locations"].append("Oslo")  # Mutating a result must not affect the cache
+        second = self.translator.translate("Find frontend developers in London")
+        
+        self.assertEqual(second["locations"], ["London"])
+        self.assertEqual(self.translator.client.messages.create.call_count, 1)
+        
+        self.translator.translate("Find frontend developers in Oslo")
+        self.assertEqual(self.translator.client.messages.create.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
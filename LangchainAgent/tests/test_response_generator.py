@@ -202,5 +202,22 @@ class TestResponseGenerator(unittest.TestCase):
         # self.assertIn("suggestions", response.lower())
         # self.assertIn("try", response.lower())
 
+    def test_response_generator_streams_response(self):
+        """Test that generate_stream yields the LLM text chunks in order."""
+        from src.response_generator import ResponseGenerator
+        
+        with patch("src.response_generator.anthropic.Anthropic") as mock_anthropic:
+            stream = MagicMock()
+            stream.text_stream = iter(["I found ", "John Doe ", "in London."])
+            mock_anthropic.return_value.messages.stream.return_value.__enter__.return_value = stream
+            generator = ResponseGenerator(anthropic_api_key="test-key")
+            
+            query = {"locations": ["London"], "skills": ["Frontend Developer"]}
+            chunks = list(generator.generate_stream(self.sample_employees, query, "Find frontend developers in London"))
+        
+        self.assertEqual(chunks, ["I found ", "John Doe ", "in London."])
+        kwargs = mock_anthropic.return_value.messages.stream.call_args.kwargs
+        self.assertIn("John Doe", kwargs["messages"][0]["content"])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file